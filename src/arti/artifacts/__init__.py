@@ -3,6 +3,7 @@ from __future__ import annotations
 __path__ = __import__("pkgutil").extend_path(__path__, __name__)
 
 import json
+from functools import lru_cache
 from itertools import chain
 from typing import TYPE_CHECKING, Annotated, Any
 
@@ -12,7 +13,7 @@ from arti.annotations import Annotation
 from arti.fingerprints import SkipFingerprint
 from arti.formats import Format
 from arti.internal.models import Model, get_field_default
-from arti.internal.type_hints import get_annotation_from_value
+from arti.internal.type_hints import NoneType, get_annotation_from_value
 from arti.statistics import Statistic
 from arti.storage import Storage
 from arti.types import Type
@@ -20,6 +21,14 @@ from arti.types import Type
 if TYPE_CHECKING:
     from arti.producers import ProducerOutput
 
+# Literal types whose values (together with the exact type) uniquely determine the cast Artifact and
+# are cheap to hash. Notably, floats are excluded because equal values may serialize differently
+# (eg: `0.0` and `-0.0`), as are containers because they may be unhashable or, like `(1, True)` and
+# `(1, 1)`, compare equal with different contents. Strings are only cached when short (eg: names or
+# flags), since each entry also holds the JSON-encoded copy and long values are rarely repeated.
+_CACHED_LITERAL_TYPES = frozenset({bool, int, NoneType})
+_MAX_CACHED_STR_LENGTH = 64
+
 
 class Artifact(Model):
     """An Artifact is the base structure describing an existing or generated dataset.
@@ -88,10 +97,7 @@ class Artifact(Model):
         - a Producer instance with a multiple output Artifacts, an error is raised
         - other types, we attempt to map to a `Type` and return an Artifact instance with defaulted Format and Storage
         """
-        from arti.formats.json import JSON
         from arti.producers import Producer
-        from arti.storage.literal import StringLiteral
-        from arti.types.python import python_type_system
 
         if isinstance(value, Artifact):
             return value
@@ -108,6 +114,24 @@ class Artifact(Model):
                 f"{type(value).__name__} produces {len(output_artifacts)} Artifacts. Try assigning each to a new name in the Graph!"
             )
 
+        if type(value) in _CACHED_LITERAL_TYPES or (
+            type(value) is str and len(value) <= _MAX_CACHED_STR_LENGTH
+        ):
+            return cls._cast_cached_literal(value)
+        return cls._cast_literal(value)
+
+    @classmethod
+    @lru_cache(maxsize=1024, typed=True)
+    def _cast_cached_literal(cls, value: Any) -> Artifact:
+        # NOTE: Artifacts are immutable, so the same instance can safely be shared between callers.
+        return cls._cast_literal(value)
+
+    @classmethod
+    def _cast_literal(cls, value: Any) -> Artifact:
+        from arti.formats.json import JSON
+        from arti.storage.literal import StringLiteral
+        from arti.types.python import python_type_system
+
         annotation = get_annotation_from_value(value)
         return cls(
             type=python_type_system.to_artigraph(annotation, hints={}),
@@ -4,7 +4,7 @@ __path__ = __import__("pkgutil").extend_path(__path__, __name__)
 
 import operator
 from dataclasses import dataclass
-from functools import reduce
+from functools import cache, lru_cache, reduce
 from typing import Any, final
 
 import annotated_types
@@ -27,9 +27,12 @@ class Fingerprint(int64):
     """
 
     def combine(self, *others: Fingerprint) -> Fingerprint:
-        return reduce(operator.xor, others, self)
+        # NOTE: XOR the plain ints and only box the final result - the int64 bounds checks on each
+        # intermediate Fingerprint otherwise dominate the cost.
+        return Fingerprint(reduce(operator.xor, map(operator.index, others), operator.index(self)))
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def from_int(cls, x: int, /) -> Fingerprint:
         return cls.from_int64(int64(x))
 
@@ -37,6 +40,16 @@ class Fingerprint(int64):
     def from_int64(cls, x: int64, /) -> Fingerprint:
         return cls(x)
 
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def from_key(cls, x: str, /) -> Fingerprint:
+        """Fingerprint a short, frequently reused key (eg: an Artifact key or a type name).
+
+        Results are cached since the same keys are fingerprinted for every snapshot and the int64
+        conversions cost far more than the hash itself. Use `from_string` for arbitrary strings.
+        """
+        return cls.from_string(x)
+
     @classmethod
     def from_string(cls, x: str, /) -> Fingerprint:
         """Fingerprint an arbitrary string.
@@ -50,6 +63,7 @@ class Fingerprint(int64):
         return cls.from_int64(int64(x))
 
     @classmethod
+    @cache
     def identity(cls) -> Fingerprint:
         """Return a Fingerprint that, when combined, will return the other Fingerprint."""
         return cls(0)
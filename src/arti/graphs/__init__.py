@@ -326,13 +326,14 @@ class GraphSnapshot(Model):
         # TODO: Resolve and statically set all available fingerprints. Specifically, we should pin
         # the Producer.fingerprint, which may by dynamic (eg: version is a Timestamp). Unbuilt
         # Artifact (partitions) won't be fully resolved yet.
-        snapshot_id = graph.fingerprint
+        # Collect the (order independent) components and combine them once at the end.
+        id_components = list[Fingerprint]()
         known_artifact_partitions = dict[str, StoragePartitionSnapshots]()
         for node, _ in graph.dependencies.items():
-            snapshot_id = snapshot_id.combine(node.fingerprint)
+            id_components.append(node.fingerprint)
             if isinstance(node, Artifact):
                 key = graph.artifact_to_key[node]
-                snapshot_id = snapshot_id.combine(Fingerprint.from_string(key))
+                id_components.append(Fingerprint.from_key(key))
                 # Include fingerprints (including content_fingerprint!) for all raw Artifact
                 # partitions, triggering a graph ID change if these artifacts change out-of-band.
                 #
@@ -345,10 +346,10 @@ class GraphSnapshot(Model):
                     if not known_artifact_partitions[key]:
                         content_str = "partitions" if is_partitioned(node.type) else "data"
                         raise ValueError(f"No {content_str} found for `{key}`: {node}")
-                    snapshot_id = snapshot_id.combine(
-                        *[partition.fingerprint for partition in known_artifact_partitions[key]]
+                    id_components.extend(
+                        partition.fingerprint for partition in known_artifact_partitions[key]
                     )
-        snapshot = cls(graph=graph, id=snapshot_id)
+        snapshot = cls(graph=graph, id=graph.fingerprint.combine(*id_components))
         # Write the discovered partitions (if not already known) and link to this new snapshot.
         with (connection or snapshot.backend).connect() as conn:
             conn.write_graph(graph)
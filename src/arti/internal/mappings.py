@@ -169,7 +169,7 @@ class TypedBox[V](Mapping[str, TypedNode[V]]):
 
     def __getitem__(self, key: str) -> TypedNode[V]:
         self, key = self._get_leaf_and_key(key)  # NOTE: reassigning self
-        if key not in self._data and self._status == "open":
+        if key not in self._data and self._status.root == "open":
             self[key] = {}
         return self._data[key]
 
@@ -188,7 +188,7 @@ class TypedBox[V](Mapping[str, TypedNode[V]]):
 
     def __setitem__(self, key: str, value: Any) -> None:
         self, key = self._get_leaf_and_key(key)  # NOTE: reassigning self
-        if self._status == "closed":
+        if self._status.root == "closed":
             raise ValueError(f"{type(self).__name__} is frozen.")
         if key in self._data:
             existing = self._data[key]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from functools import cached_property
 from typing import (
     TYPE_CHECKING,
@@ -65,6 +65,7 @@ class Model(BaseModel, metaclass=ModelMeta):
     _abstract_: ClassVar[bool] = True  # Prevent instantiation; defaults to False in subclasses
     _arti_type_key_: ClassVar[str] = class_name()
     _arti_fingerprint_fields_: tuple[str, ...] = ()  # defaulted in __pydantic_init_subclass__
+    _arti_cached_properties_: ClassVar[tuple[str, ...]] = ()  # set in __pydantic_init_subclass__
 
     # TODO: Support looking up the correct subclass when instantiating from serialized data.
     @computed_field(repr=False)
@@ -120,6 +121,16 @@ class Model(BaseModel, metaclass=ModelMeta):
                 )
             )
         )
+        # Collect the cached properties (stored in the instance `__dict__`) once, so `model_copy`
+        # can drop them without walking the MRO for each copy.
+        cls._arti_cached_properties_ = tuple(
+            {
+                name: None
+                for klass in cls.__mro__
+                for name, value in vars(klass).items()
+                if isinstance(value, cached_property)
+            }
+        )
 
     if not TYPE_CHECKING:
 
@@ -167,6 +178,16 @@ class Model(BaseModel, metaclass=ModelMeta):
             raise ValueError("Fingerprint is empty!")
         return fingerprint
 
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copy = super().model_copy(update=None if update is None else dict(update), deep=deep)
+        # Cached properties (eg: `fingerprint` or a Graph's `dependencies`) live in the instance
+        # `__dict__`, which pydantic copies as is. Drop them if any fields were changed so they are
+        # recomputed from the new values.
+        if update:
+            for name in self._arti_cached_properties_:
+                copy.__dict__.pop(name, None)
+        return copy
+
     def __repr_args__(self) -> Iterable[tuple[str | None, Any]]:
         return [(k, v) for k, v in super().__repr_args__() if k in self.model_fields_set]
 
@@ -140,11 +140,18 @@ def get_item_from_annotated[T, D](
     )
 
 
+_SCALAR_TYPES = frozenset({bool, bytes, date, datetime, float, int, str})
+
+
 def get_annotation_from_value(value: Any) -> Any:
     if value is None:
         return None
-    if isinstance(value, bool | bytes | date | datetime | float | int | str):
-        return type(value)
+    # NOTE: Check the exact type first to skip the isinstance (MRO) checks for the common builtins,
+    # but still fall back to isinstance to support subclasses (eg: numpy.float64).
+    if (value_type := type(value)) in _SCALAR_TYPES or isinstance(
+        value, bool | bytes | date | datetime | float | int | str
+    ):
+        return value_type
     if isinstance(value, tuple | list | set | frozenset):
         first, *tail = tuple(value)
         first_type = type(first)
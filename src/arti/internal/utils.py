@@ -227,11 +227,15 @@ def ordinal(n: int) -> str:
     return str(n) + suffix
 
 
+_missing: Any = object()
+
+
 def register[K, V](
     registry: dict[K, V], key: K, value: V, get_priority: Callable[[V], int] | None = None
 ) -> V:
-    if key in registry:
-        existing = registry[key]
+    # NOTE: Only the winning value is stored per key, so registration is a single dict probe and
+    # priority comparison, regardless of how many values have been registered for the key.
+    if (existing := registry.get(key, _missing)) is not _missing:
         if get_priority is None:
             raise ValueError(f"{key} is already registered with: {existing}!")
         existing_priority, new_priority = get_priority(existing), get_priority(value)
@@ -5,8 +5,6 @@ from collections.abc import Sequence
 from itertools import chain
 from typing import Any
 
-from gcsfs import GCSFileSystem
-
 from arti.formats.json import JSON
 from arti.io import register_reader, register_writer
 from arti.storage.google.cloud.storage import GCSFilePartition
@@ -18,6 +16,8 @@ from arti.views.python import PythonBuiltin
 
 
 def _read_json_file(path: str) -> Any:
+    from gcsfs import GCSFileSystem
+
     # TODO: GCSFileSystem needs to be injected somehow
     with GCSFileSystem().open(path, "r") as file:
         return json.load(file)
@@ -45,5 +45,7 @@ def _read_json_gcsfile_python(
 def _write_json_gcsfile_python(
     data: Any, type_: Type, format: JSON, storage_partition: GCSFilePartition, view: PythonBuiltin
 ) -> None:
+    from gcsfs import GCSFileSystem
+
     with GCSFileSystem().open(storage_partition.qualified_path, "w") as file:
         json.dump(data, file)
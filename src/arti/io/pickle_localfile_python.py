@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import pickle
 from collections.abc import Sequence
+from contextlib import suppress
 from itertools import chain
 from pathlib import Path
 from typing import Any
@@ -15,6 +17,11 @@ from arti.views.python import PythonBuiltin
 
 def _read_pickle_file(path: str) -> Any:
     with open(path, "rb") as file:
+        # The file is read front to back once, so hint the kernel to read ahead more aggressively
+        # where supported. The hint is advisory, so ignore files that don't support it (eg: FIFOs).
+        if hasattr(os, "posix_fadvise"):  # pragma: no branch
+            with suppress(OSError):
+                os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
         return pickle.load(file)  # noqa: S301 # User opted into pickle, ignore bandit check
 
 
@@ -47,4 +54,8 @@ def _write_pickle_localfile_python(
     path = Path(storage_partition.path)
     path.parent.mkdir(exist_ok=True, parents=True)
     with path.open("wb") as file:
-        pickle.dump(data, file)
+        # NOTE: The default protocol (4) already frames the output. The highest protocol (>=5) adds
+        # in-band `PickleBuffer` support (PEP 574), so buffer-backed objects (eg: numpy arrays) are
+        # written directly from their memory, rather than first copied into an intermediate bytes
+        # object.
+        pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
@@ -334,7 +334,7 @@ class Producer(Model):
             )
         # We only care if the *code* or *input partition contents* changed, not if the input file
         # paths changed (but have the same content as a prior run).
-        return Fingerprint.from_string(self._arti_type_key_).combine(
+        return Fingerprint.from_key(self._arti_type_key_).combine(
             self.version.fingerprint,
             *(
                 # TODO: Include the artifact name here? Do we care if you rename an arg (without
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from gcsfs import GCSFileSystem
-
 from arti import (
     Fingerprint,
     InputFingerprints,
@@ -26,6 +24,10 @@ class _GCSMixin(Model):
 
 class GCSFilePartition(_GCSMixin, StoragePartition):
     def compute_content_fingerprint(self) -> Fingerprint:
+        # NOTE: gcsfs is slow to import and arti.io loads every IO module (including the GCS ones) on
+        # first dispatch, so only import it once actually needed.
+        from gcsfs import GCSFileSystem
+
         # TODO: GCSFileSystem needs to be injected somehow
         info = GCSFileSystem().info(f"{self.bucket}/{self.path}")
         # Prefer md5Hash if available
@@ -45,6 +47,8 @@ class GCSFile(_GCSMixin, Storage[GCSFilePartition]):
     def discover_partitions(
         self, input_fingerprints: InputFingerprints = InputFingerprints()
     ) -> StoragePartitionSnapshots:
+        from gcsfs import GCSFileSystem
+
         # NOTE: The bucket/path must *already* have any graph tags resolved, otherwise they will be try to be parsed as
         # partition keys.
         spec = f"{self.bucket}/{self.path}"
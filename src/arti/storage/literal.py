@@ -3,11 +3,11 @@ from __future__ import annotations
 from arti import (
     Fingerprint,
     InputFingerprints,
-    PartitionKey,
     Storage,
     StoragePartition,
     StoragePartitionSnapshots,
 )
+from arti.partitions import NotPartitioned
 
 _not_written_err = FileNotFoundError("Literal has not been written yet")
 
@@ -47,6 +47,6 @@ class StringLiteral(Storage[StringLiteralPartition]):
                 input_fingerprint=input_fingerprint, partition_key=partition_key
             ).snapshot()
             for partition_key, input_fingerprint in (
-                input_fingerprints or {PartitionKey(): None}
+                input_fingerprints or {NotPartitioned: None}
             ).items()
         )
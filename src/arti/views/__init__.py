@@ -3,19 +3,35 @@ from __future__ import annotations
 __path__ = __import__("pkgutil").extend_path(__path__, __name__)
 
 import builtins
-from typing import Annotated, Any, ClassVar, Literal, Self, get_origin
+from operator import attrgetter
+from types import ModuleType
+from typing import Annotated, Any, ClassVar, Literal, Self, cast, get_args, get_origin
 
 from pydantic import ValidationInfo, field_validator
 
 from arti import io
 from arti.artifacts import Artifact
 from arti.internal.models import Model, ModelTypeSerializer, get_field_default
-from arti.internal.type_hints import discard_Annotated, get_item_from_annotated, lenient_issubclass
-from arti.internal.utils import import_submodules, register
+from arti.internal.type_hints import discard_Annotated, is_annotated_hint, lenient_issubclass
+from arti.internal.utils import import_submodules, one_or_none, register
 from arti.types import Type, TypeSystem
 
 MODE = Literal["READ", "WRITE", "READWRITE"]
 
+# Set by `_discover` to import the View submodules (including any added to `__path__` by other
+# distributions) only once, rather than rescanning on each lookup.
+_submodules: dict[str, ModuleType] | None = None
+
+# Lazily set in `View._get_kwargs_from_annotation` to avoid importing non-root modules upon import
+# (and repeating the import on each call).
+_python_type_system: TypeSystem | None = None
+
+
+def _discover() -> None:
+    global _submodules
+    if _submodules is None:
+        _submodules = import_submodules(__path__, __name__)
+
 
 class View(Model):
     """View represents the in-memory representation of the artifact.
@@ -38,7 +54,7 @@ class View(Model):
     def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
         super().__pydantic_init_subclass__(**kwargs)
         if not cls._abstract_:
-            register(cls._by_python_type_, cls.python_type, cls, lambda x: x.priority)
+            register(cls._by_python_type_, cls.python_type, cls, attrgetter("priority"))
 
     @classmethod
     def _check_type_compatibility(cls, view_type: Type, artifact_type: Type) -> None:
@@ -48,7 +64,9 @@ class View(Model):
         # columns on write.
         #
         # If implementing, we can leverage the `mode` to determine which should be the "superset".
-        if view_type != artifact_type:
+        # NOTE: Check identity first, which is cheap and common (eg: the Artifact's Type is reused),
+        # before falling back to the (recursive) equality check.
+        if view_type is not artifact_type and view_type != artifact_type:
             raise ValueError(
                 f"the specified Type (`{view_type}`) is not compatible with the Artifact's Type (`{artifact_type}`)."
             )
@@ -65,21 +83,54 @@ class View(Model):
         return type_
 
     @classmethod
-    def _get_kwargs_from_annotation(cls, annotation: Any) -> dict[str, Any]:
-        artifact_class = get_item_from_annotated(annotation, Artifact, kind="class")
+    def _scan_annotated(
+        cls, annotation: Any
+    ) -> tuple[builtins.type[Self] | None, builtins.type[Artifact] | None, Type | None]:
+        """Extract the (optional) View class, Artifact class, and Type from an Annotated hint.
+
+        This is equivalent to calling `get_item_from_annotated` for each, but only walks the
+        Annotated metadata once.
+        """
+        if not is_annotated_hint(annotation):
+            return None, None, None
+        _, *hints = get_args(annotation)
+        view_classes, artifact_classes, types = list[Any](), list[Any](), list[Any]()
+        for hint in hints:
+            if isinstance(hint, Type):
+                types.append(hint)
+            elif lenient_issubclass(hint, cls):
+                view_classes.append(hint)
+            elif lenient_issubclass(hint, Artifact):
+                artifact_classes.append(hint)
+        return (
+            one_or_none(view_classes, item_name=cls.__name__),
+            one_or_none(artifact_classes, item_name=Artifact.__name__),
+            one_or_none(types, item_name=Type.__name__),
+        )
+
+    @classmethod
+    def _get_kwargs_from_annotation(
+        cls,
+        annotation: Any,
+        *,
+        artifact_class: builtins.type[Artifact] | None,
+        type_: Type | None,
+    ) -> dict[str, Any]:
         if artifact_class is None:
             artifact_class = get_field_default(cls, "artifact_class")
         assert artifact_class is not None
         assert issubclass(artifact_class, Artifact)
         # Try to extract or infer the Type. We prefer: an explicit Type in the annotation, followed
         # by an Artifact's default type, falling back to inferring a Type from the type hint.
-        type_ = get_item_from_annotated(annotation, Type, kind="object")
         if type_ is None:
             artifact_type: Type | None = get_field_default(artifact_class, "type", fallback=None)
             if artifact_type is None:
-                from arti.types.python import python_type_system
+                global _python_type_system
+                if _python_type_system is None:
+                    from arti.types.python import python_type_system
 
-                type_ = python_type_system.to_artigraph(discard_Annotated(annotation), hints={})
+                    _python_type_system = python_type_system
+                type_ = _python_type_system.to_artigraph(discard_Annotated(annotation), hints={})
             else:
                 type_ = artifact_type
         # NOTE: We validate that type_ and artifact_type (if set) are compatible in _validate_type,
@@ -87,29 +138,61 @@ class View(Model):
         return {"artifact_class": artifact_class, "type": type_}
 
     @classmethod
-    def get_class_for(cls, annotation: Any) -> builtins.type[Self]:
-        view_class = get_item_from_annotated(annotation, cls, kind="class")
+    def _lookup_class_for(
+        cls, annotation: Any, view_class: builtins.type[View] | None
+    ) -> builtins.type[Self]:
         if view_class is None:
             # We've already searched for a View instance in the original Annotated args, so just
             # extract the root annotation.
             annotation = discard_Annotated(annotation)
             # Import the View submodules to trigger registration.
-            import_submodules(__path__, __name__)
+            _discover()
             view_class = cls._by_python_type_.get(annotation)
             # If no match and the type is a subscripted Generic (eg: `list[int]`), try to unwrap any
-            # extra type variables.
-            if view_class is None and (origin := get_origin(annotation)) is not None:
+            # extra type variables. Plain classes (eg: `int`) never have an origin, so we can skip
+            # the `get_origin` call for them.
+            if (
+                view_class is None
+                and type(annotation) is not type
+                and (origin := get_origin(annotation)) is not None
+            ):
                 view_class = cls._by_python_type_.get(origin)
             if view_class is None:
                 raise ValueError(
                     f"{annotation} cannot be matched to a View, try setting one explicitly (eg: `Annotated[int, arti.views.python.Int]`)"
                 )
-        return view_class
+        # `cls._by_python_type_` only holds subclasses of `cls`.
+        return cast(builtins.type[Self], view_class)
+
+    @classmethod
+    def get_class_for(cls, annotation: Any) -> builtins.type[Self]:
+        # Short circuit if we were passed a (concrete) View class directly.
+        if (
+            isinstance(annotation, type)
+            and issubclass(annotation, cls)
+            and not annotation._abstract_
+        ):
+            return annotation
+        view_class, _, _ = cls._scan_annotated(annotation)
+        return cls._lookup_class_for(annotation, view_class)
 
     @classmethod
     def from_annotation(cls, annotation: Any, *, mode: MODE) -> Self:
-        view_class = cls.get_class_for(annotation)
-        view = view_class(mode=mode, **view_class._get_kwargs_from_annotation(annotation))
+        if mode not in get_args(MODE):
+            raise ValueError(f"`mode` must be one of {get_args(MODE)}, got: {mode!r}")
+        # Treat a (concrete) View class passed directly like `Annotated[python_type, View]`.
+        if (
+            isinstance(annotation, type)
+            and issubclass(annotation, cls)
+            and not annotation._abstract_
+        ):
+            annotation = Annotated[annotation.python_type, annotation]
+        view_class, artifact_class, type_ = cls._scan_annotated(annotation)
+        view_class = cls._lookup_class_for(annotation, view_class)
+        kwargs = view_class._get_kwargs_from_annotation(
+            annotation, artifact_class=artifact_class, type_=type_
+        )
+        view = view_class(mode=mode, **kwargs)
         view.check_annotation_compatibility(annotation)
         return view
 
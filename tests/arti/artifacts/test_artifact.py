@@ -54,6 +54,18 @@ def test_cast_literals(value: Any, expected_type: Type) -> None:
     assert artifact.storage.value == json.dumps(value)
 
 
+def test_cast_literals_cached() -> None:
+    assert Artifact.cast(5) is Artifact.cast(5)
+    assert Artifact.cast("hi") is Artifact.cast("hi")
+    # Equal values of different types must not share a cache entry.
+    assert Artifact.cast(1).type == Int64()
+    assert Artifact.cast(True).type == Boolean()
+    # Floats, containers, and long strings are not cached.
+    assert Artifact.cast(5.0) is not Artifact.cast(5.0)
+    assert Artifact.cast([1]) is not Artifact.cast([1])
+    assert Artifact.cast("x" * 65) is not Artifact.cast("x" * 65)
+
+
 @pytest.mark.xfail()
 @pytest.mark.parametrize(
     ("value", "expected_type"),
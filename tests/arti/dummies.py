@@ -89,34 +89,39 @@ def dummy_writer(
     pass
 
 
+# Share (immutable) instances across the dummy Artifacts below rather than validating new ones for each.
+_dummy_format = DummyFormat()
+_dummy_storage = DummyStorage()
+
+
 class DummyStatistic(Statistic):
     type: Type = Int32()
-    format: Format = DummyFormat()
-    storage: Storage = DummyStorage()
+    format: Format = _dummy_format
+    storage: Storage = _dummy_storage
 
 
 class A1(Artifact):
     type: Type = Struct(fields={"a": Int32()})
-    format: Format = DummyFormat()
-    storage: Storage = DummyStorage()
+    format: Format = _dummy_format
+    storage: Storage = _dummy_storage
 
 
 class A2(Artifact):
     type: Type = Struct(fields={"b": Int32()})
-    format: Format = DummyFormat()
-    storage: Storage = DummyStorage()
+    format: Format = _dummy_format
+    storage: Storage = _dummy_storage
 
 
 class A3(Artifact):
     type: Type = Struct(fields={"c": Int32()})
-    format: Format = DummyFormat()
-    storage: Storage = DummyStorage()
+    format: Format = _dummy_format
+    storage: Storage = _dummy_storage
 
 
 class A4(Artifact):
     type: Type = Struct(fields={"d": Int32()})
-    format: Format = DummyFormat()
-    storage: Storage = DummyStorage()
+    format: Format = _dummy_format
+    storage: Storage = _dummy_storage
 
 
 class P1(Producer):
@@ -46,7 +46,7 @@ def test_ArtifactBox_template() -> None:
     assert g.artifacts.z.storage.id == "test/z/z.json"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def graph() -> Graph:
     # NOTE: .out() supports strict Artifact subclass mypy typing with the mypy_plugin, but Producers
     # also support simple iteration (eg: `a, b = MyProducer(...)`).
@@ -96,6 +96,21 @@ def test_Graph_copy(graph: Graph, copier: Callable[[Graph], Graph]) -> None:
     assert hash(graph) == hash(copy)
 
 
+def test_Graph_copy_update(graph: Graph) -> None:
+    # Populate the cached properties before copying.
+    for name in ["dependencies", "producers", "producer_outputs"]:
+        getattr(graph, name)
+
+    with Graph(name="other") as other:
+        other.artifacts.a = A1()
+        other.artifacts.b = P1(a1=other.artifacts.a)
+
+    copy = graph.model_copy(update={"artifacts": other.artifacts})
+    assert copy.dependencies == other.dependencies != graph.dependencies
+    assert copy.producers == other.producers != graph.producers
+    assert copy.producer_outputs == other.producer_outputs != graph.producer_outputs
+
+
 def test_Graph_literals(tmp_path: Path) -> None:
     n_add_runs = 0
 
@@ -177,8 +192,8 @@ def test_Graph_snapshot() -> None:
 
     id_components = [
         g.fingerprint,
-        Fingerprint.from_string("a"),
-        Fingerprint.from_string("b"),
+        Fingerprint.from_key("a"),
+        Fingerprint.from_key("b"),
         g.artifacts.a.fingerprint,
         g.artifacts.b.fingerprint,
         p1.fingerprint,
@@ -288,29 +303,24 @@ def test_Graph_build(tmp_path: Path) -> None:
         cast(Num, g.artifacts.c),
         cast(Num, g.artifacts.d),
     )
-    # Bootstrap the initial artifact and build
-    g.write(0, artifact=a)
-    g.build()
-    assert n_builds == 1
-    assert g.read(b, annotation=int) == 1
-    assert g.read(c, annotation=int) == g.read(d, annotation=int) == 0
-    # A second build should no-op
-    g.build(executor=LocalExecutor())
-    assert n_builds == 1
-    assert g.read(b, annotation=int) == 1
-    assert g.read(c, annotation=int) == g.read(d, annotation=int) == 0
-    # Changing the raw Artifact data should trigger a rerun
-    g.write(1, artifact=a)
-    g.build()
-    assert n_builds == 2
-    assert g.read(b, annotation=int) == 2
-    assert g.read(c, annotation=int) == g.read(d, annotation=int) == 1
-    # Changing back to the original data should no-op
-    g.write(0, artifact=a)
-    g.build()
-    assert n_builds == 2
-    assert g.read(b, annotation=int) == 1
-    assert g.read(c, annotation=int) == g.read(d, annotation=int) == 0
+    # Each cycle is: (value to write to `a` (if any), executor, n_builds, b, c/d)
+    cycles: list[tuple[int | None, LocalExecutor | None, int, int, int]] = [
+        # Bootstrap the initial artifact and build
+        (0, None, 1, 1, 0),
+        # A second build should no-op
+        (None, LocalExecutor(), 1, 1, 0),
+        # Changing the raw Artifact data should trigger a rerun
+        (1, None, 2, 2, 1),
+        # Changing back to the original data should no-op
+        (0, None, 2, 1, 0),
+    ]
+    for value, executor, expected_n_builds, expected_b, expected_cd in cycles:
+        if value is not None:
+            g.write(value, artifact=a)
+        g.build(executor=executor)
+        assert n_builds == expected_n_builds
+        assert g.read(b, annotation=int) == expected_b
+        assert g.read(c, annotation=int) == g.read(d, annotation=int) == expected_cd
 
     # Test that the MemoryBackend will discover existing StoragePartitions (*except for Literals*),
     # even when empty. Other backends are persistent, so this isn't necessary. This is really a
@@ -108,3 +108,26 @@ def test_multipledispatch_lookup() -> None:
         return value
 
     assert reg.lookup(list[int]) is _list_int
+
+
+def test_multipledispatch_cache() -> None:
+    discoveries = 0
+
+    def discover() -> None:
+        nonlocal discoveries
+        discoveries += 1
+
+    @multipledispatch("test-cache", discovery_func=discover)
+    def test(a: A, b: B) -> Any:
+        raise NotImplementedError()
+
+    @test.register
+    def good_a_b(a: A, b: B) -> Any:
+        return "good_a_b"
+
+    # Subclass arguments are resolved (and discovery run) once, then served from the dispatch table.
+    assert (A1, B1) not in test
+    assert test(A1(), B1()) == "good_a_b"
+    assert test[(A1, B1)] is good_a_b
+    assert test(A1(), B1()) == "good_a_b"
+    assert discoveries == 1
@@ -72,6 +72,15 @@ def test_Model_fingerprint() -> None:
     assert w.fingerprint == Fingerprint.from_string(w_repr)
 
 
+def test_Model_fingerprint_cache() -> None:
+    a = Concrete(i=1)
+    assert a.fingerprint is a.fingerprint
+    # Copies without changes keep the cached fingerprint.
+    assert a.model_copy().fingerprint is a.fingerprint
+    # Copies with changes must be re-fingerprinted.
+    assert a.model_copy(update={"i": 2}).fingerprint == Concrete(i=2).fingerprint != a.fingerprint
+
+
 # The rest more or less test the default Model's configuration of base pydantic functionality.
 
 
@@ -1,4 +1,7 @@
+import os
+import pickle
 from pathlib import Path
+from threading import Thread
 from typing import Annotated
 
 import pytest
@@ -14,6 +17,7 @@ from arti import (
 )
 from arti.formats.json import JSON
 from arti.formats.pickle import Pickle
+from arti.io.pickle_localfile_python import _read_pickle_file
 from arti.partitions import Int64Field
 from arti.storage.local import LocalFile
 from arti.types import Collection, Int64, Struct
@@ -41,6 +45,30 @@ def test_localfile_io(tmp_path: Path, format: Format) -> None:
         io.read(a.type, a.format, partitions * 2, view=view)
 
 
+def test_localfile_io_pickle_empty(tmp_path: Path) -> None:
+    a = Num(format=Pickle(), storage=LocalFile(path=str(tmp_path / "a")))
+    view = View.from_annotation(Annotated[int, a.type], mode="READ")
+    (tmp_path / "a").touch()
+    with pytest.raises(EOFError, match="Ran out of input"):
+        io.read(a.type, a.format, a.storage.discover_partitions(), view=view)
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires FIFO support")
+def test_localfile_io_pickle_fifo(tmp_path: Path) -> None:
+    path = tmp_path / "a"
+    os.mkfifo(path)
+
+    def write() -> None:
+        with path.open("wb") as file:
+            pickle.dump(5, file)
+
+    writer = Thread(target=write)
+    writer.start()
+    # The read ahead hint isn't supported for FIFOs, but shouldn't prevent reading.
+    assert _read_pickle_file(str(path)) == 5
+    writer.join()
+
+
 @pytest.mark.parametrize("format", [JSON(), Pickle()])
 def test_localfile_io_partitioned(tmp_path: Path, format: Format) -> None:
     a = PartitionedNum(format=format, storage=LocalFile(path=str(tmp_path / "{i.value}")))
@@ -12,9 +12,14 @@ def test_Fingerprint() -> None:
     assert Fingerprint.from_int64(int64(-5)) == -5
     assert Fingerprint.from_string("OK") == -7962813320811223369
     assert Fingerprint.from_string("ok") == 5227454011934222951
+    assert Fingerprint.from_key("ok") == Fingerprint.from_string("ok")
     assert Fingerprint.from_uint64(uint64(5)) == 5
     assert Fingerprint.from_uint64(uint64(int64(-5))) == -5
     assert Fingerprint.identity() == 0
+    # Common constructors are interned.
+    assert Fingerprint.from_int(-5) is Fingerprint.from_int(-5)
+    assert Fingerprint.from_key("ok") is Fingerprint.from_key("ok")
+    assert Fingerprint.identity() is Fingerprint.identity()
 
     with pytest.raises(ValueError, match="is too large for int64"):
         Fingerprint.from_int(uint64._max)
@@ -24,7 +24,7 @@ def test_python_View() -> None:
         assert view.type == view.type_system.to_artigraph(python_type, hints={})
 
         test_format = Pickle()
-        binary = pickle.dumps(val)
+        binary = pickle.dumps(val, protocol=pickle.HIGHEST_PROTOCOL)
         with named_temporary_file("w+b") as f:
             test_storage_partition = LocalFilePartition(path=f.name, storage=LocalFile())
 
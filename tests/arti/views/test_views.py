@@ -1,10 +1,18 @@
-from typing import Annotated, ClassVar
+from typing import Annotated, ClassVar, Literal, Self
 
 import pytest
-
-from arti import Artifact, TypeSystem, View, types
+from pydantic import (
+    AfterValidator,
+    ValidationError,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+
+from arti import Artifact, TypeSystem, View, types, views
 from arti.types import Int64
 from arti.types.python import python_type_system
+from arti.views.python import Int
 
 
 @pytest.fixture()
@@ -19,6 +27,16 @@ def MockView() -> type[View]:
     return V
 
 
+def test_View_discover() -> None:
+    View.get_class_for(int)
+    submodules = views._submodules
+    assert submodules is not None
+    assert "arti.views.python" in submodules
+    # Discovery only scans the submodules once.
+    View.get_class_for(int)
+    assert views._submodules is submodules
+
+
 def test_View_serialization(MockView: type[View]) -> None:
     class Int(MockView):
         python_type = int
@@ -28,6 +46,14 @@ def test_View_serialization(MockView: type[View]) -> None:
     assert v.model_dump_json(include="artifact_class") == '{"artifact_class":"Artifact"}'
 
 
+def test_View_hash() -> None:
+    # Views are frozen, so equal instances can be used interchangeably as cache keys.
+    v1, v2 = Int(type=Int64(), mode="READ"), Int(type=Int64(), mode="READ")
+    assert v1 is not v2
+    assert {v1: "cached"}[v2] == "cached"
+    assert hash(v1) != hash(Int(type=Int64(), mode="WRITE"))
+
+
 def test_View_registry(MockView: type[View]) -> None:
     class Int(MockView):
         python_type = int
@@ -51,6 +77,12 @@ def test_View_get_class_for(MockView: type[View]) -> None:
 
     for annotation in [list, list[int]]:
         assert MockView.get_class_for(annotation) == List
+    # Views are only matched by their exact python_type (or a Generic's origin), not superclasses.
+    with pytest.raises(ValueError, match="cannot be matched to a View, try setting one explicitly"):
+        MockView.get_class_for(object)
+    assert MockView.get_class_for(List) is List
+    with pytest.raises(ValueError, match="cannot be matched to a View, try setting one explicitly"):
+        MockView.get_class_for(MockView)
 
 
 def test_View_from_annotation(MockView: type[View]) -> None:
@@ -71,3 +103,74 @@ def test_View_from_annotation(MockView: type[View]) -> None:
 
     with pytest.raises(ValueError, match="cannot be used to represent Float64"):
         MockView.from_annotation(Annotated[list[int], types.Float64()], mode="READ")
+
+    with pytest.raises(ValueError, match="`mode` must be one of"):
+        MockView.from_annotation(list[int], mode="BAD")  # type: ignore[arg-type]
+
+    # A View class passed directly is treated like `Annotated[View.python_type, View]`.
+    assert View.from_annotation(Int, mode="READ") == View.from_annotation(
+        Annotated[int, Int], mode="READ"
+    )
+
+
+def test_View_from_annotation_validators() -> None:
+    calls = list[str]()
+
+    def record(type_: types.Type) -> types.Type:
+        calls.append("annotated")
+        return type_
+
+    class ModelValidatedInt(Int):
+        priority = Int.priority - 1
+
+        @model_validator(mode="after")
+        def _record(self) -> Self:
+            calls.append("model")
+            return self
+
+    class FieldValidatedInt(Int):
+        priority = Int.priority - 1
+
+        @field_validator("type")
+        @classmethod
+        def _validate_type(cls, type_: types.Type, info: ValidationInfo) -> types.Type:
+            calls.append("field")
+            return type_
+
+    class AnnotatedValidatedInt(Int):
+        priority = Int.priority - 1
+
+        type: Annotated[types.Type, AfterValidator(record)]
+
+    # Views are fully validated by `from_annotation`, including any validators added by subclasses.
+    for view_class, expected in [
+        (ModelValidatedInt, "model"),
+        (FieldValidatedInt, "field"),
+        (AnnotatedValidatedInt, "annotated"),
+    ]:
+        calls.clear()
+        view = View.from_annotation(Annotated[int, view_class], mode="READ")
+        assert isinstance(view, view_class)
+        assert calls == [expected]
+
+
+def test_View_from_annotation_narrowed_fields() -> None:
+    class Int64Int(Int):
+        priority = Int.priority - 1
+
+        type: types.Int64
+
+    class ReadOnlyInt(Int):
+        priority = Int.priority - 1
+
+        mode: Literal["READ"]
+
+    assert isinstance(View.from_annotation(Annotated[int, Int64Int], mode="READ"), Int64Int)
+    with pytest.raises(
+        ValidationError, match="Input should be a valid dictionary or instance of Int64"
+    ):
+        View.from_annotation(Annotated[int, Int64Int, types.Int32()], mode="READ")
+
+    assert isinstance(View.from_annotation(Annotated[int, ReadOnlyInt], mode="READ"), ReadOnlyInt)
+    with pytest.raises(ValidationError, match="Input should be 'READ'"):
+        View.from_annotation(Annotated[int, ReadOnlyInt], mode="WRITE")